@@ -1,8 +1,5 @@
+import hashlib
 import streamlit as st 
-from helper import (
-    get_text_from_image , 
-    get_speech_from_text
-)
 
 def project() : 
     '''
@@ -13,36 +10,60 @@ def project() :
     Returns:
     '''
 
+    from helper import (
+        get_text_from_image , 
+        get_speech_from_text , 
+        speak_while_streaming
+    )
+
     image = st.file_uploader('Upload an image' , type = ['jpg' , 'jpeg' , 'png' , 'webp'])
 
     if image :
 
-        with st.spinner('Extracting and Analysing Text from the Image, Please Hang Tight !!') : 
+        key = hashlib.sha1(image.getvalue()).hexdigest()
+
+        if key in st.session_state : 
+
+            text , audio = st.session_state[key]
+            st.write(text)
+
+        else : 
+
+            speech = []
+            errors = []
+
+            with st.spinner('Extracting and Analysing Text from the Image, Please Hang Tight !!') : 
+
+                text = st.write_stream(speak_while_streaming(get_text_from_image(image , errors = errors) , speech))
+
+            with st.spinner('Getting Text to Speech') : 
+                segments = []
+
+                try : 
+                    for sentence , future in speech : 
+
+                        try : segments.append(future.result())
+                        except Exception : segments.append(get_speech_from_text(sentence))
 
-            text = get_text_from_image(image)
+                    audio = b''.join(segments)
 
-        st.write(text)
+                except Exception : audio = None
 
-        with st.spinner('Getting Text to Speech') : 
-            get_speech_from_text(text)
+            if not errors and audio is not None : st.session_state[key] = (text , audio)
 
-        st.audio('audio.wav' , format = 'audio/wav')
+        if audio is None : st.warning('Could not generate the speech, please try again')
+        elif audio : st.audio(audio , format = 'audio/mp3')
 
 def report() : pass
 def synopsis() : pass
 def teams() : pass
 
 
-option = st.sidebar.selectbox(
-    'Go to' , 
-    [
-        'Project' ,
-        'Report' , 
-        'Synopsis' , 
-        'Teams'
-    ])
+page = st.navigation([
+    st.Page(project , title = 'Project') , 
+    st.Page(report , title = 'Report') , 
+    st.Page(synopsis , title = 'Synopsis') , 
+    st.Page(teams , title = 'Teams')
+])
 
-if option == 'Project' : project()
-elif option == 'Report' : report()
-elif option == 'Synopsis' : synopsis()
-elif option == 'Teams' : teams()
+page.run()